@@ -22,6 +22,8 @@ a = Analysis(
     datas=[
         # ShellShow's own stylesheet — placed at shellshow/app.tcss inside the bundle
         ("shellshow/app.tcss", "shellshow"),
+        # Help screen texts, read through importlib.resources
+        ("shellshow/screens/help_data", "shellshow/screens/help_data"),
         # Textual and pyfiglet bundled assets
         *textual_datas,
         *pyfiglet_datas,
@@ -15,14 +15,17 @@ class BlockType(Enum):
     ALERT = "alert"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Metadata:
     """Parsed metadata from a style[...] or meta[...] line."""
     style: str | None = None
     props: dict[str, str] = field(default_factory=dict)
+    # Derived from the above by the parser, so renderers needn't re-derive them.
+    cached_style: str | None = None  # Rich style for style[...], or meta bg/text/color
+    padding: int | tuple[int, ...] | None = None  # meta padding, as Rich Padding accepts it
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     type: BlockType
     content: str | list[str]  # list[str] for TABLE rows
@@ -30,14 +33,14 @@ class Block:
     language: str | None = None  # for CODE blocks
 
 
-@dataclass
+@dataclass(slots=True)
 class Page:
     title: str
     blocks: list[Block] = field(default_factory=list)
     parent_title: str | None = None   # H1 section this page belongs to (h2 mode)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectMeta:
     """Project-level metadata parsed from the leading HTML comment block."""
     color: str | None = None      # global default text color (overridable per block)
@@ -1,27 +1,79 @@
 """Markdown parser that converts a .md file into Pages and Blocks."""
 
-import re
+import functools
+import hashlib
+import io
+import os
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain
 from pathlib import Path
 
 from .models import Block, BlockType, Metadata, Page, ProjectMeta
 
-_METADATA_RE = re.compile(r"^<!--\s*(style|meta)\[([^\]]*)\]\s*-->$")
 
+_HEADING_PREFIXES = ("# ", "## ", "### ")
+_BULLET_PREFIXES = ("- ", "* ", "+ ")
+_ALERT_KINDS = frozenset({"NOTE", "TIP", "IMPORTANT", "WARNING", "CAUTION"})
 
-def _parse_metadata(line: str) -> Metadata | None:
-    """Return a Metadata object for a style[...] or meta[...] line, else None."""
-    m = _METADATA_RE.match(line.strip())
-    if not m:
+_READ_BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE * 8
+
+# Number of files whose parse results are kept (by _parse_file and _SECTION_CACHE).
+_CACHED_FILES = 32
+
+# Parsed sections of each file from its latest parse, keyed by a hash of
+# the section text, for reuse when the file is parsed again after an edit.
+# Holds the _CACHED_FILES most recently parsed paths.
+_SECTION_CACHE: OrderedDict[str, dict[bytes, tuple[list[Page], Metadata | None]]] = OrderedDict()
+
+
+def _parse_metadata(stripped: str) -> Metadata | None:
+    """Return a Metadata object for a ``<!-- style[...] -->`` or
+    ``<!-- meta[...] -->`` line, or None if *stripped* is neither.
+    """
+    if len(stripped) < 7 or not (stripped.startswith("<!--") and stripped.endswith("-->")):
+        return None
+    kind, bracket, rest = stripped[4:-3].strip().partition("[")
+    if not bracket or kind not in ("style", "meta") or not rest.endswith("]"):
+        return None
+    content = rest[:-1]
+    if "]" in content:
         return None
-    kind, content = m.group(1), m.group(2)
     if kind == "style":
-        return Metadata(style=content)
+        return Metadata(style=content, cached_style=content or None)
     props: dict[str, str] = {}
     for pair in content.split("|"):
         if ":" in pair:
             k, v = pair.split(":", 1)
             props[k.strip()] = v.strip()
-    return Metadata(props=props)
+    return Metadata(props=props, cached_style=_meta_style(props), padding=_meta_padding(props))
+
+
+def _meta_style(props: dict[str, str]) -> str | None:
+    """Return the Rich style for a meta line's ``bg``, ``text`` and ``color`` props."""
+    parts = [f"on {bg}"] if (bg := props.get("bg")) else []
+    if weight := props.get("text"):
+        parts.append(weight)
+    if color := props.get("color"):
+        parts.append(color)
+    return " ".join(parts) or None
+
+
+def _meta_padding(props: dict[str, str]) -> int | tuple[int, ...] | None:
+    """Return the ``padding`` prop as 1, 2 or 4 integers (CSS shorthand),
+    or None if it is missing or malformed.
+    """
+    pad_str = props.get("padding")
+    if not pad_str:
+        return None
+    try:
+        parts = tuple(int(x) for x in pad_str.split())
+    except ValueError:
+        return None
+    if len(parts) not in (1, 2, 4):
+        return None
+    return parts[0] if len(parts) == 1 else parts
 
 
 def _parse_project_meta(lines: list[str]) -> tuple[ProjectMeta | None, int]:
@@ -83,11 +135,57 @@ def _parse_project_meta(lines: list[str]) -> tuple[ProjectMeta | None, int]:
     ), i
 
 
-def _is_table_separator(line: str) -> bool:
-    return bool(re.match(r"^\|[\s\-:|]+\|$", line.strip()))
+def _is_hr(stripped: str) -> bool:
+    """True for a stripped line of three or more ``-``, ``*`` or ``_`` characters."""
+    return len(stripped) >= 3 and not stripped.strip("-*_")
+
+
+def _is_ul_item(raw: str) -> bool:
+    """True for an unordered list item: optional indent, ``-``/``*``/``+``, space."""
+    return raw.lstrip().startswith(_BULLET_PREFIXES)
 
 
-def parse_markdown(path: Path) -> tuple[list[Page], ProjectMeta | None]:
+def _is_ol_item(raw: str) -> bool:
+    """True for an ordered list item: optional indent, digits, ``.``, space."""
+    number, dot, _ = raw.lstrip().partition(". ")
+    return bool(dot) and number.isdecimal()
+
+
+def _alert_kind(stripped: str) -> str | None:
+    """Return the upper-cased kind of a ``> [!KIND]`` alert line, or None."""
+    rest = stripped[1:].lstrip()
+    if not rest.startswith("[!"):
+        return None
+    name, bracket, _ = rest[2:].partition("]")
+    kind = name.upper()
+    return kind if bracket and kind in _ALERT_KINDS else None
+
+
+def _is_h1(raw: str) -> bool:
+    return raw.startswith("# ") and len(raw) > 2 and raw[2] != "#"
+
+
+def _split_project_meta(lines: Iterator[str]) -> tuple[ProjectMeta | None, Iterator[str]]:
+    """Consume an optional project-metadata comment from the start of *lines*.
+
+    Only the comment itself is buffered. Returns (ProjectMeta | None, the
+    remaining lines); if the comment is not closed, every buffered line is
+    handed back to be parsed as ordinary content.
+    """
+    first = next(lines, None)
+    if first is None:
+        return None, lines
+    head = [first]
+    if first.strip() == "<!--":
+        for line in lines:
+            head.append(line)
+            if line.strip() == "-->":
+                break
+    project_meta, skip = _parse_project_meta(head)
+    return project_meta, chain(head[skip:], lines)
+
+
+def parse_markdown(path: Path, use_cache: bool = True) -> tuple[list[Page], ProjectMeta | None]:
     """Parse a Markdown file and return (pages, project_meta).
 
     Rules:
@@ -97,148 +195,259 @@ def parse_markdown(path: Path) -> tuple[list[Page], ProjectMeta | None]:
     - A metadata line (<!-- style[...] --> or <!-- meta[...] -->) is consumed
       silently and attached to the next Block.
     - Unsupported elements (images, blockquotes) are skipped.
+
+    Results are cached per file and reused until its modification time or
+    size changes, so callers must treat the returned objects as read-only.
+    Pass ``use_cache=False`` to always re-read the file (e.g. an explicit
+    reload): timestamps can be coarse, and an edit may keep the same size.
     """
-    all_lines = path.read_text(encoding="utf-8").splitlines()
-    project_meta, skip = _parse_project_meta(all_lines)
-    lines = all_lines[skip:]
-    pages: list[Page] = []
-    current_page: Page | None = None
-    pending_meta: Metadata | None = None
-    current_h1_title: str | None = None
-    page_sep = (project_meta.page_separator if project_meta else "h2")
-
-    def _ensure_page() -> Page:
-        nonlocal current_page
-        if current_page is None:
-            current_page = Page(title="")
-            pages.append(current_page)
-        return current_page
-
-    def _add_block(block: Block) -> None:
-        nonlocal pending_meta
-        block.metadata = pending_meta
-        pending_meta = None
-        _ensure_page().blocks.append(block)
-
-    i = 0
-    while i < len(lines):
-        raw = lines[i]
-        stripped = raw.strip()
+    if not use_cache:
+        _parse_file.cache_clear()
+    st = path.stat()
+    return _parse_file(os.fspath(path), st.st_mtime_ns, st.st_size)
 
-        # ── Metadata line ────────────────────────────────────────────────
-        if _METADATA_RE.match(stripped):
-            pending_meta = _parse_metadata(stripped)
-            i += 1
-            continue
 
-        # ── Skip images ──────────────────────────────────────────────────
-        if stripped.startswith("!["):
-            i += 1
-            continue
+@functools.lru_cache(maxsize=_CACHED_FILES)
+def _parse_file(path: str, mtime_ns: int, size: int) -> tuple[list[Page], ProjectMeta | None]:
+    """Parse *path*; *mtime_ns* and *size* only key the cache.
 
-        # ── GitHub-style alert or plain blockquote ───────────────────────
-        if stripped.startswith(">"):
-            alert_m = re.match(
-                r"^>\s*\[!(NOTE|TIP|IMPORTANT|WARNING|CAUTION)\]",
-                stripped,
-                re.IGNORECASE,
-            )
-            if alert_m:
-                kind = alert_m.group(1).upper()
-                alert_lines: list[str] = []
-                i += 1
-                while i < len(lines) and lines[i].strip().startswith(">"):
-                    alert_lines.append(re.sub(r"^>\s?", "", lines[i]))
-                    i += 1
-                _add_block(
-                    Block(
-                        type=BlockType.ALERT,
-                        content="\n".join(alert_lines),
-                        language=kind,
-                    )
-                )
-            else:
-                i += 1  # regular blockquote — skip
-            continue
+    The body is parsed one H1 section at a time. Sections whose text is
+    unchanged since the previous parse of the same file reuse their Pages,
+    so after an edit only the touched sections are parsed again.
+    """
+    with open(path, "r", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as f:
+        project_meta, lines = _split_project_meta(line.rstrip("\n") for line in f)
+        page_sep = (project_meta.page_separator if project_meta else "h2")
+        previous = _SECTION_CACHE.get(path, {})
+        current: dict[bytes, tuple[list[Page], Metadata | None]] = {}
+        pages: list[Page] = []
+        pending_meta: Metadata | None = None
+        for section in _iter_sections(lines):
+            key = hashlib.blake2b(
+                "\n".join(section).encode("utf-8"), digest_size=16, person=page_sep.encode()
+            ).digest()
+            # A metadata line left pending by the previous section attaches to
+            # this section's H1, so its result cannot come from (or go to)
+            # the cache.
+            result = previous.get(key) if pending_meta is None else None
+            if result is None:
+                result = _SectionParser(section, page_sep, pending_meta).parse()
+            if pending_meta is None:
+                current[key] = result
+            section_pages, pending_meta = result
+            pages.extend(section_pages)
+    _SECTION_CACHE[path] = current
+    _SECTION_CACHE.move_to_end(path)
+    if len(_SECTION_CACHE) > _CACHED_FILES:
+        _SECTION_CACHE.popitem(last=False)
+    return pages, project_meta
 
-        # ── H1 → new page ───────────────────────────────────────────────
-        if re.match(r"^# [^#]", raw):
-            title = raw[2:].strip()
-            current_page = Page(title=title)
-            pages.append(current_page)
-            block = Block(type=BlockType.H1, content=title)
-            block.metadata = pending_meta
-            pending_meta = None
-            current_page.blocks.append(block)
-            if page_sep == "h2":
-                current_h1_title = title
-            i += 1
-            continue
 
+def _iter_sections(lines: Iterable[str]) -> Iterator[list[str]]:
+    """Split *lines* into sections that each start at an H1 line.
+
+    The first section holds any lines before the first H1. H1-looking lines
+    inside fenced code blocks do not start a section.
+    """
+    section: list[str] = []
+    in_fence = False
+    for line in lines:
+        if line.startswith("```"):
+            in_fence = not in_fence
+        elif section and not in_fence and _is_h1(line):
+            yield section
+            section = []
+        section.append(line)
+    if section:
+        yield section
+
+
+class _SectionParser:
+    """Parse one section's lines (without line endings); see parse_markdown().
+
+    *pending_meta* is a metadata line left unattached by the previous
+    section. parse() returns the section's pages and the metadata left
+    unattached at its end.
+    """
+
+    __slots__ = ("_lines", "_page_sep", "_pages", "_current_page", "_current_h1_title", "_pending_meta")
+
+    def __init__(self, section: list[str], page_sep: str, pending_meta: Metadata | None) -> None:
+        self._lines = iter(section)
+        self._page_sep = page_sep
+        self._pages: list[Page] = []
+        self._current_page: Page | None = None
+        self._current_h1_title: str | None = None
+        self._pending_meta = pending_meta
+
+    def parse(self) -> tuple[list[Page], Metadata | None]:
+        # Bound method as a local — avoids an attribute lookup per line.
+        dispatch_get = _SECTION_DISPATCH.get
+        for line in self._lines:
+            raw: str | None = line
+            while raw is not None:
+                first = raw[:1]
+                if not first or first.isspace():
+                    stripped = raw.strip()
+                    if not stripped:
+                        break  # empty line
+                    first = stripped[0]
+                elif first not in _SECTION_DISPATCH and not first.isdecimal():
+                    # Plain paragraph text: no handler needs the stripped line.
+                    self._add_block(BlockType.TEXT, raw)
+                    break
+                else:
+                    stripped = raw.strip()
+                handler = dispatch_get(first)
+                if handler is None:
+                    # Non-ASCII decimal digits can still start an ordered list item.
+                    handler = _SectionParser._on_digit if first.isdecimal() else _SectionParser._on_text
+                raw = handler(self, raw, stripped)
+        return self._pages, self._pending_meta
+
+    def _ensure_page(self) -> Page:
+        if self._current_page is None:
+            self._current_page = Page(title="")
+            self._pages.append(self._current_page)
+        return self._current_page
+
+    def _add_block(
+        self, type: BlockType, content: str | list[str], language: str | None = None
+    ) -> None:
+        block = Block(type=type, content=content, metadata=self._pending_meta, language=language)
+        self._pending_meta = None
+        self._ensure_page().blocks.append(block)
+
+    def _start_page(self, type: BlockType, title: str, parent_title: str | None = None) -> None:
+        self._current_page = Page(title=title, parent_title=parent_title)
+        self._pages.append(self._current_page)
+        self._add_block(type, title)
+
+    # ── Line handlers ────────────────────────────────────────────────────
+    # Selected through _SECTION_DISPATCH by the first character of the
+    # stripped line. Each one runs only the narrow check(s) for that
+    # character and falls back to paragraph text if they fail. Handlers
+    # that consume following lines from the stream return the first line
+    # they read but did not use, so the main loop can process it next; all
+    # others return None.
+
+    def _on_text(self, raw: str, stripped: str) -> None:
+        self._add_block(BlockType.TEXT, raw)
+
+    def _on_angle(self, raw: str, stripped: str) -> None:
+        if (meta := _parse_metadata(stripped)) is not None:
+            self._pending_meta = meta
+        else:
+            self._on_text(raw, stripped)
+
+    def _on_bang(self, raw: str, stripped: str) -> None:
+        # Images are not supported — skip them.
+        if not stripped.startswith("!["):
+            self._on_text(raw, stripped)
+
+    def _on_quote(self, raw: str, stripped: str) -> str | None:
+        # GitHub-style alert or plain blockquote
+        kind = _alert_kind(stripped)
+        if kind is None:
+            return None  # regular blockquote — skip
+        kind = sys.intern(kind)
+        alert_lines: list[str] = []
+        rest: str | None = None
+        for line in self._lines:
+            if not line.strip().startswith(">"):
+                rest = line
+                break
+            if line.startswith(">"):
+                # Drop the ">" and at most one whitespace character after it.
+                line = line[2:] if line[1:2].isspace() else line[1:]
+            alert_lines.append(line)
+        self._add_block(BlockType.ALERT, "\n".join(alert_lines), kind)
+        return rest
+
+    def _on_hash(self, raw: str, stripped: str) -> None:
+        if not raw.startswith(_HEADING_PREFIXES):
+            self._on_text(raw, stripped)
+            return
+        level = raw.index(" ")  # the prefix is 1–3 '#' followed by a space
+        rest = raw[level + 1:]
+        if level < 3 and (not rest or rest[0] == "#"):
+            self._on_text(raw, stripped)  # "# #x" or "## " — not a heading
+            return
+        title = rest.strip()
+        # ── H1 → new page ───────────────────────────────────────────────
+        if level == 1:
+            self._start_page(BlockType.H1, title)
+            if self._page_sep == "h2":
+                self._current_h1_title = title
         # ── H2 ──────────────────────────────────────────────────────────
-        if re.match(r"^## [^#]", raw):
-            if page_sep == "h2":
-                title = raw[3:].strip()
-                current_page = Page(title=title, parent_title=current_h1_title)
-                pages.append(current_page)
-                block = Block(type=BlockType.H2, content=title)
-                block.metadata = pending_meta
-                pending_meta = None
-                current_page.blocks.append(block)
+        elif level == 2:
+            if self._page_sep == "h2":
+                self._start_page(BlockType.H2, title, parent_title=self._current_h1_title)
             else:
-                _add_block(Block(type=BlockType.H2, content=raw[3:].strip()))
-            i += 1
-            continue
-
+                self._add_block(BlockType.H2, title)
         # ── H3 ──────────────────────────────────────────────────────────
-        if re.match(r"^### ", raw):
-            _add_block(Block(type=BlockType.H3, content=raw[4:].strip()))
-            i += 1
-            continue
+        else:
+            self._add_block(BlockType.H3, title)
 
+    def _on_backtick(self, raw: str, stripped: str) -> None:
         # ── Fenced code block ────────────────────────────────────────────
-        if raw.startswith("```"):
-            lang = raw[3:].strip() or None
-            code_lines: list[str] = []
-            i += 1
-            while i < len(lines) and not lines[i].startswith("```"):
-                code_lines.append(lines[i])
-                i += 1
-            i += 1  # consume closing ```
-            if lang == "image":
-                _add_block(Block(type=BlockType.IMAGE, content="\n".join(code_lines)))
-            else:
-                _add_block(Block(type=BlockType.CODE, content="\n".join(code_lines), language=lang))
-            continue
-
-        # ── Horizontal rule ──────────────────────────────────────────────
-        if re.match(r"^[-*_]{3,}\s*$", stripped) and stripped:
-            _add_block(Block(type=BlockType.HR, content=""))
-            i += 1
-            continue
-
+        if not raw.startswith("```"):
+            self._on_text(raw, stripped)
+            return
+        lang = sys.intern(raw[3:].strip()) or None
+        code_lines: list[str] = []
+        for line in self._lines:
+            if line.startswith("```"):
+                break  # closing ``` is consumed
+            code_lines.append(line)
+        if lang == "image":
+            self._add_block(BlockType.IMAGE, "\n".join(code_lines))
+        else:
+            self._add_block(BlockType.CODE, "\n".join(code_lines), lang)
+
+    def _on_rule_or_bullet(self, raw: str, stripped: str) -> None:
+        # `-` and `*` may start either a horizontal rule or a list item;
+        # `_` only a rule and `+` only a list item.
+        if _is_hr(stripped):
+            self._add_block(BlockType.HR, "")
+        elif _is_ul_item(raw):
+            self._add_block(BlockType.LIST_ITEM, raw)
+        else:
+            self._on_text(raw, stripped)
+
+    def _on_pipe(self, raw: str, stripped: str) -> str | None:
         # ── Table (consecutive | lines) ──────────────────────────────────
-        if raw.startswith("|"):
-            table_lines: list[str] = []
-            while i < len(lines) and lines[i].startswith("|"):
-                table_lines.append(lines[i])
-                i += 1
-            _add_block(Block(type=BlockType.TABLE, content=table_lines))
-            continue
-
-        # ── List item (unordered or ordered) ────────────────────────────
-        if re.match(r"^\s*[-*+] ", raw) or re.match(r"^\s*\d+\. ", raw):
-            _add_block(Block(type=BlockType.LIST_ITEM, content=raw))
-            i += 1
-            continue
-
-        # ── Non-empty paragraph text ─────────────────────────────────────
-        if stripped:
-            _add_block(Block(type=BlockType.TEXT, content=raw))
-            i += 1
-            continue
-
-        # ── Empty line ───────────────────────────────────────────────────
-        i += 1
-
-    return pages, project_meta
+        if not raw.startswith("|"):
+            self._on_text(raw, stripped)
+            return None
+        table_lines = [raw]
+        rest: str | None = None
+        for line in self._lines:
+            if not line.startswith("|"):
+                rest = line
+                break
+            table_lines.append(line)
+        self._add_block(BlockType.TABLE, table_lines)
+        return rest
+
+    def _on_digit(self, raw: str, stripped: str) -> None:
+        if _is_ol_item(raw):
+            self._add_block(BlockType.LIST_ITEM, raw)
+        else:
+            self._on_text(raw, stripped)
+
+
+# Line handlers by the first character of the stripped line.
+_SECTION_DISPATCH: dict[str, Callable[[_SectionParser, str, str], str | None]] = {
+    "<": _SectionParser._on_angle,
+    "!": _SectionParser._on_bang,
+    ">": _SectionParser._on_quote,
+    "#": _SectionParser._on_hash,
+    "`": _SectionParser._on_backtick,
+    "-": _SectionParser._on_rule_or_bullet,
+    "*": _SectionParser._on_rule_or_bullet,
+    "_": _SectionParser._on_rule_or_bullet,
+    "+": _SectionParser._on_rule_or_bullet,
+    "|": _SectionParser._on_pipe,
+    **dict.fromkeys("0123456789", _SectionParser._on_digit),
+}
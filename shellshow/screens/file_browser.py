@@ -1,24 +1,52 @@
 """Modal file browser for selecting a Markdown presentation file."""
 
 import asyncio
+import os
 from pathlib import Path
-from typing import Iterable
+from typing import Iterator
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
 from textual.screen import ModalScreen
 from textual.widgets import Button, DirectoryTree, Static, Tree
+from textual.widgets.directory_tree import DirEntry
+from textual.widgets.tree import TreeNode
+from textual.worker import Worker
 from textual._work_decorator import work
 
 
 class _MdDirectoryTree(DirectoryTree):
     """DirectoryTree that shows only directories and .md files."""
 
-    def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
-        return [p for p in paths if p.is_dir() or p.suffix.lower() == ".md"]
+    def _directory_content(self, location: Path, worker: Worker) -> Iterator[Path]:
+        """Yield the directories and .md files in *location*.
 
-    def on_mount(self) -> None:
+        Classifies entries from os.scandir's DirEntry (no stat for most
+        file systems) instead of filtering Path objects afterwards.
+        """
+        # Overrides DirectoryTree's private directory iterator: it is the only
+        # hook that sees the scandir entries, and it runs in the load worker
+        # thread. Textual's own fresh is_dir checks are left as they are.
+        try:
+            with os.scandir(location) as entries:
+                for entry in entries:
+                    if worker.is_cancelled:
+                        break
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    name = entry.name
+                    if is_dir or (name.lower().endswith(".md") and name != ".md"):
+                        yield Path(entry.path)
+        except OSError:
+            pass
+
+    async def watch_path(self) -> None:
+        # DirectoryTree loads the root here; walking towards cwd any earlier
+        # would descend into nodes that this load then replaces.
+        await super().watch_path()
         self.expand_to(Path.cwd())
 
     @work
@@ -31,25 +59,30 @@ class _MdDirectoryTree(DirectoryTree):
 
         node = self.root
         for part in parts:
-            node.expand()
-            # Poll until children are loaded (up to ~1 s).
-            child_map: dict[str, object] = {}
-            for _ in range(20):
-                await asyncio.sleep(0.05)
-                child_map = {}
-                for child in node.children:
-                    try:
-                        child_map[child.data.path.name] = child
-                    except AttributeError:
-                        pass
-                if child_map:
+            if node.data is not None and not node.data.loaded:
+                # reload_node loads and expands the directory, and its awaitable
+                # completes once the children are in place (empty directories
+                # included). Shielded so a slow load (over 1 s) finishes in the
+                # background instead of being cancelled half-way.
+                try:
+                    await asyncio.wait_for(asyncio.shield(self.reload_node(node)), timeout=1.0)
+                except TimeoutError:
                     break
 
-            next_node = child_map.get(part)
+            next_node = None
+            for child in node.children:
+                if child.data is not None and child.data.path.name == part:
+                    next_node = child
+                    break
             if next_node is None:
                 break
             node = next_node
 
+        # Node line numbers are only valid once the expanded tree has been laid
+        # out again, so move the cursor after the next refresh.
+        self.call_after_refresh(self._show_node, node)
+
+    def _show_node(self, node: TreeNode[DirEntry]) -> None:
         self.scroll_to_node(node, animate=False)
         self.move_cursor(node)
 
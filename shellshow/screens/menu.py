@@ -1,5 +1,6 @@
 """Main menu screen with ASCII logo and navigation options."""
 
+import functools
 from pathlib import Path
 
 import pyfiglet
@@ -14,12 +15,17 @@ from .. import __version__ as _CURRENT_VERSION
 from ..parser import parse_markdown
 from ..updater import GITHUB_REPO, check_for_update
 from .file_browser import FileBrowserScreen
-from .help import HelpScreen
+from .help import HelpScreen, preload_help
+
+
+@functools.cache
+def _logo() -> str:
+    """The figlet logo, rendered the first time the menu is composed."""
+    try:
+        return pyfiglet.figlet_format("ShellShow", font="doom")
+    except pyfiglet.FontNotFound:
+        return pyfiglet.figlet_format("ShellShow")
 
-try:
-    _LOGO = pyfiglet.figlet_format("ShellShow", font="doom")
-except pyfiglet.FontNotFound:
-    _LOGO = pyfiglet.figlet_format("ShellShow")
 
 _VERSION = f"v{_CURRENT_VERSION}"
 _UPDATE_URL = f"https://github.com/{GITHUB_REPO}/releases"
@@ -44,7 +50,7 @@ class MenuScreen(Screen):
         with Center():
             with Middle():
                 with Container(id="menu-box"):
-                    yield Static(_LOGO, id="logo")
+                    yield Static(_logo(), id="logo")
                     yield Static("The CLI presentation tool", id="tagline")
                     yield Static("", id="loaded-file")
                     yield Button("Start Presentation [dim](p)[/]", variant="success", id="btn-start")
@@ -54,11 +60,17 @@ class MenuScreen(Screen):
                     yield Button("Exit [dim](esc)[/]", variant="default", id="btn-exit")
 
     def on_mount(self) -> None:
-        self.query_one("#loaded-file").display = False
-        self.query_one("#btn-start").display = False
-        self.query_one("#btn-reload").display = False
-        self.query_one("#menu-update").display = False
+        # Cached once; these are updated on every file selection.
+        self._loaded_file = self.query_one("#loaded-file", Static)
+        self._btn_start = self.query_one("#btn-start", Button)
+        self._btn_reload = self.query_one("#btn-reload", Button)
+        self._update_notice = self.query_one("#menu-update", Static)
+        self._loaded_file.display = False
+        self._btn_start.display = False
+        self._btn_reload.display = False
+        self._update_notice.display = False
         self._check_for_update()
+        self._preload_help()
 
     @work(thread=True)
     def _check_for_update(self) -> None:
@@ -67,14 +79,18 @@ class MenuScreen(Screen):
         if latest:
             self.call_from_thread(self._show_update_notice, latest)
 
+    @work(thread=True, exit_on_error=False)
+    def _preload_help(self) -> None:
+        """Prepare the Help screen's text in the background while the menu is idle."""
+        preload_help()
+
     def _show_update_notice(self, latest: str) -> None:
         notice = (
             f"[bold yellow]Update available:[/] [cyan]{latest}[/]  —  "
             f"[dim]{_UPDATE_URL}[/]"
         )
-        widget = self.query_one("#menu-update", Static)
-        widget.update(notice)
-        widget.display = True
+        self._update_notice.update(notice)
+        self._update_notice.display = True
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn-load":
@@ -99,7 +115,7 @@ class MenuScreen(Screen):
     def _do_reload(self) -> None:
         assert self._loaded_path is not None
         try:
-            pages, _ = parse_markdown(self._loaded_path)
+            pages, _ = parse_markdown(self._loaded_path, use_cache=False)
         except Exception as exc:
             self.notify(f"Reload failed: {exc}", severity="error", timeout=5)
             return
@@ -122,7 +138,7 @@ class MenuScreen(Screen):
         if path is None:
             return
         self._loaded_path = path
-        self.query_one("#loaded-file", Static).update(f"[dim]Loaded:[/] [cyan]{path.name}[/]")
-        self.query_one("#loaded-file").display = True
-        self.query_one("#btn-start").display = True
-        self.query_one("#btn-reload").display = True
+        self._loaded_file.update(f"[dim]Loaded:[/] [cyan]{path.name}[/]")
+        self._loaded_file.display = True
+        self._btn_start.display = True
+        self._btn_reload.display = True
@@ -1,9 +1,13 @@
 """Presentation screen - displays slides with per-block reveal."""
 
+import functools
 import re
+from collections.abc import Callable
+from itertools import groupby
 
 import pyfiglet
 from rich.align import Align
+from rich.console import RenderableType
 from rich.panel import Panel
 from rich.padding import Padding
 from rich.rule import Rule
@@ -13,14 +17,16 @@ from rich.table import Table
 from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
-from textual.containers import Container, VerticalScroll
+from textual.containers import Container, Vertical, VerticalScroll
 from textual.css.scalar import ScalarOffset
 from textual.screen import Screen
 from textual.widgets import Footer, Static
 
 from ..models import Block, BlockType, Metadata, Page, ProjectMeta
-from .toc_modal import TocModal
+from .toc_modal import TocModal, toc_labels
 
+# The link groups are possessive: their character classes can't overlap the
+# closing bracket, so backtracking into them could never find a match.
 _INLINE_RE = re.compile(
     r"\*{3}(.+?)\*{3}"                            # 1: ***bold italic***
     r"|(?<!\w)_{3}(.+?)_{3}(?!\w)"               # 2: ___bold italic___
@@ -33,9 +39,14 @@ _INLINE_RE = re.compile(
     r"|<ins>(.+?)</ins>"                           # 9: <ins>underline</ins>
     r"|<sub>(.+?)</sub>"                           # 10: <sub>subscript</sub> (plain)
     r"|<sup>(.+?)</sup>"                           # 11: <sup>superscript</sup> (plain)
-    r"|\[([^\]]+)\]\(([^)]+)\)"                   # 12+13: [text](url)
+    r"|\[([^\]]++)\]\(([^)]++)\)"                 # 12+13: [text](url)
 )
 
+# First characters of the _INLINE_RE alternatives.
+_INLINE_MARKERS = "*_~`<["
+
+_TABLE_SEP_RE = re.compile(r"^\|[\s\-:|]+\|$")
+
 _INLINE_STYLES = [
     "bold italic",      # 1: ***
     "bold italic",      # 2: ___
@@ -50,37 +61,72 @@ _INLINE_STYLES = [
     "",                 # 11: <sup> (no terminal support)
 ]
 
+# Border colour and title of each GitHub alert kind.
+_ALERT_STYLES: dict[str, tuple[str, str]] = {
+    "NOTE":      ("bright_blue",  "Note"),
+    "TIP":       ("bright_green", "Tip"),
+    "IMPORTANT": ("magenta",      "Important"),
+    "WARNING":   ("yellow",       "Warning"),
+    "CAUTION":   ("bright_red",   "Caution"),
+}
+
 
 def _parse_inline(raw: str, base_style: str = "") -> Text:
     """Convert markdown inline formatting tokens to a Rich Text with style spans."""
+    if not any(marker in raw for marker in _INLINE_MARKERS):
+        # Plain prose: no _INLINE_RE alternative can match, and nothing worth caching.
+        return Text(raw, style=base_style)
+    return _cached_inline(raw, base_style).copy()
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_inline(raw: str, base_style: str) -> Text:
+    """Memoized body of _parse_inline(); the result is shared, so never modify it.
+
+    Matched spans are parsed again for nested markup so that e.g. **[link](url)**
+    renders as a bold clickable link rather than raw markdown. Rather than
+    recursing, each nesting level is a frame on an explicit stack, and every
+    level appends straight into the one result Text.
+    """
     result = Text(style=base_style)
-    pos = 0
-    for m in _INLINE_RE.finditer(raw):
+    # Frames are [text, its matches, scan position, style, start offset in result];
+    # the style is applied over the frame's output once it has been scanned.
+    stack: list[list] = [[raw, _INLINE_RE.finditer(raw), 0, "", 0]]
+    while stack:
+        frame = stack[-1]
+        text, matches, pos = frame[0], frame[1], frame[2]
+        m = next(matches, None)
+        if m is None:
+            if pos < len(text):
+                result.append(text[pos:])
+            stack.pop()
+            if frame[3]:
+                result.stylize(frame[3], frame[4])
+            continue
         if m.start() > pos:
-            result.append(raw[pos : m.start()])
-        groups = m.groups()
-        # Groups 12+13 (index 11+12) are the link text and URL — handled specially.
-        if groups[11] is not None:
-            link_text = groups[11]
-            url = groups[12] or ""
-            result.append(link_text, style=f"underline bright_blue link {url}")
+            result.append(text[pos : m.start()])
+        frame[2] = m.end()
+        group = m.lastindex
+        # Groups 12+13 are the link text and URL — handled specially.
+        if group == 13:
+            result.append(m[12], style=f"underline bright_blue link {m[13]}")
         else:
-            for idx, inner in enumerate(groups[:11]):
-                if inner is not None:
-                    # Recursively parse the inner content so that e.g. **[link](url)**
-                    # correctly renders as a bold clickable link rather than raw markdown.
-                    inner_text = _parse_inline(inner)
-                    style = _INLINE_STYLES[idx]
-                    if style:
-                        inner_text.stylize(style)
-                    result.append_text(inner_text)
-                    break
-        pos = m.end()
-    if pos < len(raw):
-        result.append(raw[pos:])
+            inner = m[group]
+            stack.append([inner, _INLINE_RE.finditer(inner), 0, _INLINE_STYLES[group - 1], len(result)])
     return result
 
 
+@functools.lru_cache(maxsize=128)
+def _figlet(text: str, font: str, width: int) -> str:
+    """Memoized pyfiglet.figlet_format().
+
+    In h2 mode every slide of a section repeats its H1 title as figlet, the
+    title page is redrawn each time it is revisited, and resizing back to an
+    earlier width redraws titles already rendered.
+    """
+    return pyfiglet.figlet_format(text, font=font, width=width)
+
+
 _PIXEL_PALETTE: dict[str, str | None] = {
     "0": None,       # transparent
     "1": "#ff5555",  # red
@@ -94,6 +140,12 @@ _PIXEL_PALETTE: dict[str, str | None] = {
     "9": "#bd93f9",  # purple
 }
 
+# Background style for each coloured digit; transparent and unknown digits have none.
+_PIXEL_STYLES: dict[str, str] = {d: f"on {c}" for d, c in _PIXEL_PALETTE.items() if c}
+
+# CSS classes of each block's Static widget.
+_CLASS_FOR_TYPE: dict[BlockType, str] = {bt: f"block block-{bt.value}" for bt in BlockType}
+
 
 class PresentationScreen(Screen):
     BINDINGS = [
@@ -122,6 +174,16 @@ class PresentationScreen(Screen):
         # Title page is always shown first.
         self._on_title_page: bool = True
         self._on_toc_page: bool = False
+        # Per-page renderables, built on first visit (see _page_renderables).
+        self._renderables: dict[int, tuple[RenderableType | None, list[RenderableType]]] = {}
+        self._renderables_width: int | None = None
+        # Per-page container and block widgets, mounted on first visit (see _page_view).
+        self._page_views: dict[int, tuple[Vertical, list[Static]]] = {}
+        self._shown_view: Vertical | None = None
+        # What the slide header currently shows, so unchanged updates are skipped.
+        self._header_key: tuple[str, int, int, int] | None = None
+        # Contents modal entries, built on first open.
+        self._toc_labels: list[str] | None = None
 
     # ── Compose ──────────────────────────────────────────────────────────
 
@@ -130,7 +192,8 @@ class PresentationScreen(Screen):
         with Container(id="title-page"):
             yield Static("", id="title-art")
             yield Static("", id="title-bottom")
-        yield Container(id="toc-page")
+        with Container(id="toc-page"):
+            yield Static("", id="toc-body")
         yield VerticalScroll(id="content")
         yield Footer()
 
@@ -138,19 +201,25 @@ class PresentationScreen(Screen):
         if self.exit_on_back:
             self._bindings.bind("escape", "back_to_menu", description="Exit", show=True)
             self._bindings.bind("q", "back_to_menu", description="Exit", show=False)
+        # Cached once; navigation touches these on every key press.
+        self._header = self.query_one("#pres-header", Static)
+        self._title_page = self.query_one("#title-page", Container)
+        self._toc_page = self.query_one("#toc-page", Container)
+        self._toc_body = self.query_one("#toc-body", Static)
+        self._content = self.query_one("#content", VerticalScroll)
         if self.project_meta and self.project_meta.slide_bg:
             self.styles.background = self.project_meta.slide_bg
         if self._on_title_page:
-            self.query_one("#content", VerticalScroll).display = False
-            self.query_one("#toc-page", Container).display = False
+            self._content.display = False
+            self._toc_page.display = False
             self._show_title_page()
         elif self._on_toc_page:
-            self.query_one("#title-page", Container).display = False
-            self.query_one("#content", VerticalScroll).display = False
+            self._title_page.display = False
+            self._content.display = False
             self._show_toc_page()
         else:
-            self.query_one("#title-page", Container).display = False
-            self.query_one("#toc-page", Container).display = False
+            self._title_page.display = False
+            self._toc_page.display = False
             self._render_current_state()
 
     # ── Helpers ──────────────────────────────────────────────────────────
@@ -164,7 +233,11 @@ class PresentationScreen(Screen):
         title = page.title or "(untitled)"
         total_blocks = max(0, len(page.blocks) - 1)  # exclude H1
         visible_blocks = max(0, self.current_block_idx - 1)
-        self.query_one("#pres-header", Static).update(
+        key = (title, self.current_page_idx, visible_blocks, total_blocks)
+        if key == self._header_key:
+            return
+        self._header_key = key
+        self._header.update(
             f" [bold cyan]{title}[/]  "
             f"[dim]│[/]  Page {self.current_page_idx + 1}/{len(self.pages)}"
             f"  [dim]│[/]  Block {visible_blocks}/{total_blocks}"
@@ -177,14 +250,14 @@ class PresentationScreen(Screen):
             return pm.title
         for page in self.pages:
             for block in page.blocks:
-                if block.type == BlockType.H1:
+                if block.type is BlockType.H1:
                     return str(block.content)
         return ""
 
     def _show_title_page(self) -> None:
         pm = self.project_meta
         title = self._effective_title()
-        figlet = pyfiglet.figlet_format(title or " ", font="standard", width=self.app.console.width)
+        figlet = _figlet(title or " ", "standard", self.app.console.width)
         title_style = f"bold {pm.color}" if pm and pm.color else "bold bright_white"
         title_text = Text(figlet, style=title_style)
         self.query_one("#title-art", Static).update(Align(title_text, "center"))
@@ -196,7 +269,8 @@ class PresentationScreen(Screen):
             bottom.append(pm.date, style="#6c7086")
         self.query_one("#title-bottom", Static).update(bottom)
 
-        self.query_one("#pres-header", Static).update(
+        self._header_key = None
+        self._header.update(
             f" [bold cyan]{title}[/]  "
             f"[dim]│[/]  Title Page"
             f"  [dim]│[/]  {len(self.pages)} slide{'s' if len(self.pages) != 1 else ''}"
@@ -204,27 +278,25 @@ class PresentationScreen(Screen):
 
     def _go_to_title_page(self) -> None:
         self._on_title_page = True
-        self.query_one("#content", VerticalScroll).display = False
-        self.query_one("#toc-page", Container).display = False
-        self.query_one("#title-page", Container).display = True
+        self._content.display = False
+        self._toc_page.display = False
+        self._title_page.display = True
         self._show_title_page()
 
     def _leave_title_page(self) -> None:
         self._on_title_page = False
-        self.query_one("#title-page", Container).display = False
+        self._title_page.display = False
         if self.project_meta and self.project_meta.table_of_content:
             self._on_toc_page = True
-            self.query_one("#toc-page", Container).display = True
+            self._toc_page.display = True
             self._show_toc_page()
         else:
-            self.query_one("#content", VerticalScroll).display = True
+            self._content.display = True
             self.current_page_idx = 0
             self.current_block_idx = 1
             self._render_current_state()
 
     def _show_toc_page(self) -> None:
-        toc = self.query_one("#toc-page", Container)
-        toc.remove_children()
         t = Text()
         t.append("Table of Contents\n\n", style="bold cyan")
         for i, page in enumerate(self.pages):
@@ -234,8 +306,9 @@ class PresentationScreen(Screen):
             else:
                 t.append(f"{i + 1}.  ", style="dim cyan")
                 t.append((page.title or "(untitled)") + "\n", style="bold")
-        toc.mount(Static(t))
-        self.query_one("#pres-header", Static).update(
+        self._toc_body.update(t)
+        self._header_key = None
+        self._header.update(
             " [bold cyan]Table of Contents[/]  "
             f"[dim]│[/]  {len(self.pages)} slide{'s' if len(self.pages) != 1 else ''}"
         )
@@ -243,64 +316,109 @@ class PresentationScreen(Screen):
     def _go_to_toc_page(self) -> None:
         self._on_title_page = False
         self._on_toc_page = True
-        self.query_one("#title-page", Container).display = False
-        self.query_one("#content", VerticalScroll).display = False
-        self.query_one("#toc-page", Container).display = True
+        self._title_page.display = False
+        self._content.display = False
+        self._toc_page.display = True
         self._show_toc_page()
 
     def _leave_toc_page(self) -> None:
         self._on_toc_page = False
-        self.query_one("#toc-page", Container).display = False
-        self.query_one("#content", VerticalScroll).display = True
+        self._toc_page.display = False
+        self._content.display = True
         self.current_page_idx = 0
         self.current_block_idx = 1
         self._render_current_state()
 
-    def _render_current_state(self) -> None:
-        container = self.query_one("#content", VerticalScroll)
-        container.remove_children()
-        page = self._page
-        widgets: list[Static] = []
-
+    def _page_renderables(self, page_idx: int) -> tuple[RenderableType | None, list[RenderableType]]:
+        """Return (parent H1 renderable or None, one renderable per block) for a page.
+
+        Built on the page's first visit and reused by later navigation. All
+        pages are rebuilt after the terminal width changes, since figlet
+        titles are laid out for the current width.
+        """
+        width = self.app.console.width
+        if width != self._renderables_width:
+            self._renderables.clear()
+            self._renderables_width = width
+        renderables = self._renderables.get(page_idx)
+        if renderables is None:
+            renderables = self._renderables[page_idx] = self._build_page_renderables(self.pages[page_idx])
+        return renderables
+
+    def _build_page_renderables(self, page: Page) -> tuple[RenderableType | None, list[RenderableType]]:
+        parent: RenderableType | None = None
         if page.parent_title is not None:
             # h2 mode: show the parent H1 section as figlet above slide content
-            figlet = pyfiglet.figlet_format(
-                page.parent_title, font="standard", width=self.app.console.width
-            )
+            figlet = _figlet(page.parent_title, "standard", self.app.console.width)
             t = Text(figlet, style="bold bright_white")
             self._apply_meta(t, None)  # apply project color if set
-            widgets.append(Static(Align(t, "left"), classes="block block-h1"))
+            parent = Align(t, "left")
 
-        for idx, block in enumerate(page.blocks[: self.current_block_idx]):
-            if idx == 0 and page.parent_title is not None and block.type == BlockType.H2:
+        blocks: list[RenderableType] = []
+        for idx, block in enumerate(page.blocks):
+            if idx == 0 and page.parent_title is not None and block.type is BlockType.H2:
                 # H2 is the slide subtitle in h2 mode — render as underlined
                 t = _parse_inline(str(block.content), base_style="bold underline cyan")
                 self._apply_meta(t, block.metadata)
-                widgets.append(Static(Align(t, "left"), classes="block block-h2"))
+                blocks.append(Align(t, "left"))
             else:
-                widgets.append(Static(self._to_renderable(block), classes=f"block block-{block.type.value}"))
+                blocks.append(self._to_renderable(block))
+        return parent, blocks
+
+    def _page_view(self, page_idx: int) -> tuple[Vertical, list[Static]]:
+        """Return (page container, one widget per block), mounting them on first visit.
+
+        The widgets stay mounted while the page is hidden; navigation only
+        toggles their display.
+        """
+        view = self._page_views.get(page_idx)
+        if view is None:
+            page = self.pages[page_idx]
+            parent, renderables = self._page_renderables(page_idx)
+            widgets = [
+                Static(renderable, classes=_CLASS_FOR_TYPE[block.type])
+                for block, renderable in zip(page.blocks, renderables)
+            ]
+            for widget in widgets:
+                widget.display = False
+            children = widgets if parent is None else [Static(parent, classes="block block-h1"), *widgets]
+            page_container = Vertical(*children, classes="page")
+            page_container.display = False
+            self._content.mount(page_container)
+            view = self._page_views[page_idx] = (page_container, widgets)
+        return view
 
-        if widgets:
-            container.mount(*widgets)
+    def _render_current_state(self) -> None:
+        if self.app.console.width != self._renderables_width:
+            # Figlet titles are laid out for the old width; remount pages as they're revisited.
+            for page_container, _ in self._page_views.values():
+                page_container.remove()
+            self._page_views.clear()
+            self._shown_view = None
+        page_container, widgets = self._page_view(self.current_page_idx)
+        if self._shown_view is not page_container:
+            if self._shown_view is not None:
+                self._shown_view.display = False
+            page_container.display = True
+            self._shown_view = page_container
+        for idx, widget in enumerate(widgets):
+            widget.display = idx < self.current_block_idx
         self._update_header()
-        self.call_after_refresh(container.scroll_end)
+        self.call_after_refresh(self._content.scroll_end)
 
     def _apply_meta(self, text: Text, meta: Metadata | None) -> Text:
-        parts: list[str] = []
-        if meta is not None:
-            if meta.style:
-                parts.append(meta.style)
-            if bg := meta.props.get("bg"):
-                parts.append(f"on {bg}")
-            if weight := meta.props.get("text"):
-                parts.append(weight)
-        # Local color overrides project-level default; fall back to project default.
-        local_color = meta.props.get("color") if meta else None
-        effective_color = local_color or (self.project_meta.color if self.project_meta else None)
-        if effective_color:
-            parts.append(effective_color)
-        if parts:
-            text.stylize(" ".join(parts))
+        project_color = self.project_meta.color if self.project_meta else None
+        if meta is None:
+            # Most blocks carry no metadata; only the project colour can apply.
+            if project_color:
+                text.stylize(project_color)
+            return text
+        style = meta.cached_style
+        # Local color (already in cached_style) overrides the project-level default.
+        if project_color and not meta.props.get("color"):
+            style = f"{style} {project_color}" if style else project_color
+        if style:
+            text.stylize(style)
         return text
 
     # ── Animation ────────────────────────────────────────────────────────
@@ -351,20 +469,15 @@ class PresentationScreen(Screen):
             # bg for Table/HR — Text uses _apply_meta; Syntax uses background_color param
             if (bg := meta.props.get("bg")) and not isinstance(renderable, (Text, Syntax)):
                 renderable = Styled(renderable, f"on {bg}")
-            # padding — accepts 1, 2, or 4 space-separated integers (CSS shorthand)
-            if pad_str := meta.props.get("padding"):
-                try:
-                    parts = [int(x) for x in pad_str.split()]
-                    pad = parts[0] if len(parts) == 1 else tuple(parts)  # type: ignore[assignment]
-                    renderable = Padding(renderable, pad)  # type: ignore[arg-type]
-                except (ValueError, TypeError):
-                    pass
+            # padding — 1, 2, or 4 integers (CSS shorthand), validated by the parser
+            if meta.padding is not None:
+                renderable = Padding(renderable, meta.padding)  # type: ignore[arg-type]
         # List items are always left-aligned unless explicitly overridden per block.
         # Other blocks: per-block meta > project align > left.
         per_block_align = meta.props.get("align") if meta else None
         if per_block_align:
             align = per_block_align
-        elif block.type == BlockType.LIST_ITEM:
+        elif block.type is BlockType.LIST_ITEM:
             align = "left"
         else:
             align = (self.project_meta.align if self.project_meta else None) or "left"
@@ -372,82 +485,68 @@ class PresentationScreen(Screen):
         return renderable
 
     def _build_renderable(self, block: Block):
+        return _BUILDERS.get(block.type, PresentationScreen._build_plain)(self, block)
+
+    # ── Block builders ───────────────────────────────────────────────────
+    # Selected through _BUILDERS by block type.
+
+    def _build_h1(self, block: Block) -> Text:
+        figlet = _figlet(str(block.content), "standard", self.app.console.width)
+        t = Text(figlet, style="bold bright_white")
+        return self._apply_meta(t, block.metadata)
+
+    def _build_h2(self, block: Block) -> Text:
+        t = _parse_inline(f"  {block.content}", base_style="bold cyan")
+        return self._apply_meta(t, block.metadata)
+
+    def _build_h3(self, block: Block) -> Text:
+        t = _parse_inline(f"    {block.content}", base_style="bold blue")
+        return self._apply_meta(t, block.metadata)
+
+    def _build_text(self, block: Block) -> Text:
+        t = _parse_inline(str(block.content))
+        return self._apply_meta(t, block.metadata)
+
+    def _build_code(self, block: Block) -> Syntax:
         meta = block.metadata
-        match block.type:
-            case BlockType.H1:
-                figlet = pyfiglet.figlet_format(
-                    str(block.content),
-                    font="standard",
-                    width=self.app.console.width,
-                )
-                t = Text(figlet, style="bold bright_white")
-                self._apply_meta(t, meta)
-                return t
-            case BlockType.H2:
-                t = _parse_inline(f"  {block.content}", base_style="bold cyan")
-                self._apply_meta(t, meta)
-                return t
-            case BlockType.H3:
-                t = _parse_inline(f"    {block.content}", base_style="bold blue")
-                self._apply_meta(t, meta)
-                return t
-            case BlockType.TEXT:
-                t = _parse_inline(str(block.content))
-                self._apply_meta(t, meta)
-                return t
-            case BlockType.CODE:
-                return Syntax(
-                    str(block.content),
-                    block.language or "text",
-                    theme="monokai",
-                    line_numbers=True,
-                    padding=(1, 2),
-                    background_color=meta.props.get("bg") if meta else None,
-                )
-            case BlockType.LIST_ITEM:
-                t = _parse_inline(str(block.content))
-                self._apply_meta(t, meta)
-                return t
-            case BlockType.TABLE:
-                return self._render_table(block)
-            case BlockType.HR:
-                return Rule(style="dim")
-            case BlockType.ALERT:
-                _ALERT_STYLES: dict[str, tuple[str, str]] = {
-                    "NOTE":      ("bright_blue",  "Note"),
-                    "TIP":       ("bright_green", "Tip"),
-                    "IMPORTANT": ("magenta",      "Important"),
-                    "WARNING":   ("yellow",       "Warning"),
-                    "CAUTION":   ("bright_red",   "Caution"),
-                }
-                kind = (block.language or "NOTE").upper()
-                color, title = _ALERT_STYLES.get(kind, ("white", kind.capitalize()))
-                content_text = _parse_inline(str(block.content))
-                return Panel(
-                    content_text,
-                    title=f"[bold {color}]{title}[/]",
-                    border_style=color,
-                    expand=True,
-                )
-            case BlockType.IMAGE:
-                t = self._render_image(block)
-                self._apply_meta(t, meta)
-                return t
-            case _:
-                return Text(str(block.content))
+        return Syntax(
+            str(block.content),
+            block.language or "text",
+            theme="monokai",
+            line_numbers=True,
+            padding=(1, 2),
+            background_color=meta.props.get("bg") if meta else None,
+        )
+
+    def _build_rule(self, block: Block) -> Rule:
+        return Rule(style="dim")
+
+    def _build_alert(self, block: Block) -> Panel:
+        kind = (block.language or "NOTE").upper()
+        color, title = _ALERT_STYLES.get(kind, ("white", kind.capitalize()))
+        content_text = _parse_inline(str(block.content))
+        return Panel(
+            content_text,
+            title=f"[bold {color}]{title}[/]",
+            border_style=color,
+            expand=True,
+        )
+
+    def _build_image(self, block: Block) -> Text:
+        t = self._render_image(block)
+        return self._apply_meta(t, block.metadata)
+
+    def _build_plain(self, block: Block) -> Text:
+        return Text(str(block.content))
 
     def _render_image(self, block: Block) -> Text:
-        rows = [line for line in str(block.content).splitlines() if line]
         text = Text()
-        for row_idx, row in enumerate(rows):
-            for digit in row:
-                color = _PIXEL_PALETTE.get(digit)
-                if color:
-                    text.append("  ", style=f"on {color}")
-                else:
-                    text.append("  ")
-            if row_idx < len(rows) - 1:
+        for row_idx, row in enumerate(filter(None, str(block.content).splitlines())):
+            if row_idx:
                 text.append("\n")
+            # One append and one style lookup per run of equal digits, not per pixel.
+            for digit, run in groupby(row):
+                text.append("  " * sum(1 for _ in run), style=_PIXEL_STYLES.get(digit))
         return text
 
     def _render_table(self, block: Block) -> Table:
@@ -459,7 +558,7 @@ class PresentationScreen(Screen):
         for h in headers:
             table.add_column(h)
         start = 1
-        if len(lines) > 1 and re.match(r"^\|[\s\-:|]+\|$", lines[1].strip()):
+        if len(lines) > 1 and _TABLE_SEP_RE.match(lines[1].strip()):
             start = 2
         for line in lines[start:]:
             cells = [c.strip() for c in line.strip("|").split("|")]
@@ -478,16 +577,12 @@ class PresentationScreen(Screen):
         page = self._page
         if self.current_block_idx < len(page.blocks):
             block = page.blocks[self.current_block_idx]
+            widget = self._page_view(self.current_page_idx)[1][self.current_block_idx]
             self.current_block_idx += 1
-            container = self.query_one("#content", VerticalScroll)
-            widget = Static(
-                self._to_renderable(block),
-                classes=f"block block-{block.type.value}",
-            )
-            container.mount(widget)
+            widget.display = True
             self._animate_block_widget(widget, block)
             self._update_header()
-            self.call_after_refresh(container.scroll_end)
+            self.call_after_refresh(self._content.scroll_end)
         elif self.current_page_idx < len(self.pages) - 1:
             self.current_page_idx += 1
             self.current_block_idx = 1
@@ -501,7 +596,9 @@ class PresentationScreen(Screen):
             return
         if self.current_block_idx > 1:
             self.current_block_idx -= 1
-            self._render_current_state()
+            self._page_view(self.current_page_idx)[1][self.current_block_idx].display = False
+            self._update_header()
+            self.call_after_refresh(self._content.scroll_end)
         elif self.current_page_idx > 0:
             self.current_page_idx -= 1
             self.current_block_idx = len(self.pages[self.current_page_idx].blocks)
@@ -544,17 +641,34 @@ class PresentationScreen(Screen):
                 return
             self._on_title_page = False
             self._on_toc_page = False
-            self.query_one("#title-page", Container).display = False
-            self.query_one("#toc-page", Container).display = False
-            self.query_one("#content", VerticalScroll).display = True
+            self._title_page.display = False
+            self._toc_page.display = False
+            self._content.display = True
             self.current_page_idx = result
             self.current_block_idx = 1
             self._render_current_state()
 
-        self.app.push_screen(TocModal(self.pages, self.current_page_idx), on_dismiss)
+        if self._toc_labels is None:
+            self._toc_labels = toc_labels(self.pages)
+        self.app.push_screen(TocModal(self._toc_labels, self.current_page_idx), on_dismiss)
 
     def action_back_to_menu(self) -> None:
         if self.exit_on_back:
             self.app.exit()
         else:
             self.app.pop_screen()
+
+
+# Renderable builders by block type; unknown types fall back to _build_plain.
+_BUILDERS: dict[BlockType, Callable[[PresentationScreen, Block], RenderableType]] = {
+    BlockType.H1: PresentationScreen._build_h1,
+    BlockType.H2: PresentationScreen._build_h2,
+    BlockType.H3: PresentationScreen._build_h3,
+    BlockType.TEXT: PresentationScreen._build_text,
+    BlockType.CODE: PresentationScreen._build_code,
+    BlockType.LIST_ITEM: PresentationScreen._build_text,
+    BlockType.TABLE: PresentationScreen._render_table,
+    BlockType.HR: PresentationScreen._build_rule,
+    BlockType.ALERT: PresentationScreen._build_alert,
+    BlockType.IMAGE: PresentationScreen._build_image,
+}
@@ -9,24 +9,30 @@ from textual.widgets import Button, Label, ListView, ListItem
 from ..models import Page
 
 
+def toc_labels(pages: list[Page]) -> list[str]:
+    """Return the modal's list entry for each page; h2-mode sub-slides are indented."""
+    labels: list[str] = []
+    for i, page in enumerate(pages):
+        if page.parent_title is not None:
+            labels.append(f"  {i + 1}.  {page.title or '(untitled)'}")
+        else:
+            labels.append(f"{i + 1}.  {page.title or '(untitled)'}")
+    return labels
+
+
 class TocModal(ModalScreen):
     """Modal that lists all slides; navigate with ↑/↓, Enter to jump, Escape to close."""
 
     BINDINGS = [Binding("escape", "close", "Close")]
 
-    def __init__(self, pages: list[Page], current_page_idx: int) -> None:
+    def __init__(self, labels: list[str], current_page_idx: int) -> None:
+        """*labels* come from toc_labels(); the caller builds them once per deck."""
         super().__init__()
-        self.pages = pages
+        self.labels = labels
         self.current_page_idx = current_page_idx
 
     def compose(self) -> ComposeResult:
-        items: list[ListItem] = []
-        for i, page in enumerate(self.pages):
-            if page.parent_title is not None:
-                label = f"  {i + 1}.  {page.title or '(untitled)'}"
-            else:
-                label = f"{i + 1}.  {page.title or '(untitled)'}"
-            items.append(ListItem(Label(label), id=f"toc-page-{i}"))
+        items = [ListItem(Label(label), id=f"toc-page-{i}") for i, label in enumerate(self.labels)]
 
         with Container(id="toc-modal-wrap") as wrap:
             wrap.border_title = "Table of Contents"
@@ -4,6 +4,11 @@ Queries the GitHub Releases API and compares the latest tag to the installed
 version. Designed to be called from a Textual @work(thread=True) worker so it
 never blocks the TUI.
 
+The result is cached under ``$XDG_CACHE_HOME/shellshow`` (default
+``~/.cache/shellshow``): within a day of the last check no request is made,
+and after that the cached ETag is sent as ``If-None-Match`` so an unchanged
+release costs a bodyless 304.
+
 Usage in a Textual screen
 --------------------------
     from textual import work
@@ -19,7 +24,11 @@ Usage in a Textual screen
 from __future__ import annotations
 
 import json
+import os
+import time
+import urllib.error
 import urllib.request
+from pathlib import Path
 
 from shellshow import __version__ as _CURRENT_VERSION
 
@@ -28,38 +37,83 @@ GITHUB_REPO = "your-github-username/shellshow"
 
 _API_URL = "https://api.github.com/repos/{repo}/releases/latest"
 _TIMEOUT = 3  # seconds — short enough to never noticeably lag the TUI
+_CHECK_INTERVAL = 24 * 60 * 60  # seconds — reuse the cached result for a day
+_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")) / "shellshow" / "latest_release.json"
+)
+
+
+def _read_cache() -> tuple[str, str, float] | None:
+    """Return the cached (etag, tag, checked-at timestamp) of the last release lookup, or None."""
+    try:
+        data = json.loads(_CACHE_FILE.read_text(encoding="utf-8"))
+        etag, tag, checked = data["etag"], data["tag"], data["checked"]
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    if isinstance(etag, str) and isinstance(tag, str) and isinstance(checked, (int, float)):
+        return etag, tag, checked
+    return None
+
+
+def _write_cache(etag: str, tag: str) -> None:
+    """Store the ETag and tag of a release lookup made now; failures are ignored."""
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _CACHE_FILE.write_text(json.dumps({"etag": etag, "tag": tag, "checked": time.time()}), encoding="utf-8")
+    except OSError:
+        pass
+
 
+def _fetch_latest_tag(repo: str, cached: tuple[str, str, float] | None = None) -> str | None:
+    """Return the latest release tag from GitHub, or None on any failure.
 
-def _fetch_latest_tag(repo: str) -> str | None:
-    """Return the latest release tag from GitHub, or None on any failure."""
+    *cached* is the previous lookup from _read_cache(); its ETag makes the
+    request conditional.
+    """
     url = _API_URL.format(repo=repo)
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "User-Agent": f"shellshow/{_CURRENT_VERSION}",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    if cached and cached[0]:
+        headers["If-None-Match"] = cached[0]
     try:
-        req = urllib.request.Request(
-            url,
-            headers={
-                "Accept": "application/vnd.github+json",
-                "User-Agent": f"shellshow/{_CURRENT_VERSION}",
-                "X-GitHub-Api-Version": "2022-11-28",
-            },
-        )
+        req = urllib.request.Request(url, headers=headers)
         with urllib.request.urlopen(req, timeout=_TIMEOUT) as resp:
             data = json.loads(resp.read().decode())
+            etag = resp.headers.get("ETag") or ""
         tag: str = data["tag_name"]
+        if not isinstance(tag, str):
+            return None
         # Strip accidental "v" prefix (e.g. "v1.2.0" → "1.2.0")
-        return tag.lstrip("v") if isinstance(tag, str) else None
+        tag = tag.lstrip("v")
+        _write_cache(etag, tag)
+        return tag
+    except urllib.error.HTTPError as exc:
+        # 304 Not Modified: the release is unchanged since the cached response.
+        if exc.code == 304 and cached:
+            _write_cache(cached[0], cached[1])
+            return cached[1]
+        return None
     except Exception:
         return None
 
 
-def _is_newer(latest: str, current: str) -> bool:
-    """Return True if *latest* is strictly higher than *current* (semver tuple compare)."""
-    def _parse(v: str) -> tuple[int, ...]:
-        try:
-            return tuple(int(x) for x in v.split("."))
-        except ValueError:
-            return (0,)
+def _parse_version(v: str) -> tuple[int, ...]:
+    """Return *v* ("1.2.0") as an int tuple for comparison, or (0,) if malformed."""
+    try:
+        return tuple(int(x) for x in v.split("."))
+    except ValueError:
+        return (0,)
+
+
+_CURRENT_TUPLE = _parse_version(_CURRENT_VERSION)
+
 
-    return _parse(latest) > _parse(current)
+def _is_newer(latest: str) -> bool:
+    """Return True if *latest* is strictly higher than the installed version (semver tuple compare)."""
+    return _parse_version(latest) > _CURRENT_TUPLE
 
 
 def check_for_update() -> str | None:
@@ -71,7 +125,11 @@ def check_for_update() -> str | None:
 
     This is a blocking call — run it from a background thread.
     """
-    latest = _fetch_latest_tag(GITHUB_REPO)
-    if latest and _is_newer(latest, _CURRENT_VERSION):
+    cached = _read_cache()
+    if cached and 0 <= time.time() - cached[2] < _CHECK_INTERVAL:
+        latest: str | None = cached[1]
+    else:
+        latest = _fetch_latest_tag(GITHUB_REPO, cached)
+    if latest and _is_newer(latest):
         return latest
     return None